@@ -1,11 +1,18 @@
 from flask import Flask, render_template, jsonify
-from markupsafe import Markup
-from scraper import scrape_all_sites, parse_timestamp, load_keywords, load_apt_keywords
+from markupsafe import Markup, escape
+from scraper import (
+    create_session,
+    scrape_all_sites_async,
+    parse_timestamp,
+    load_all_keywords,
+    is_word_char,
+    build_keyword_automaton,
+)
 from datetime import datetime
+from typing import Dict
+import asyncio
 import threading
-import time
 from urllib.parse import urlparse
-import re
 
 app = Flask(__name__)
 
@@ -23,82 +30,112 @@ def extract_domain(url):
         return url
 
 
+def _lower_keep_offsets(text):
+    """Lowercase text without changing its length (so offsets stay valid)"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters (e.g. "İ") expand when lowercased; keep the first char
+    return "".join(char.lower()[0] for char in text)
+
+
+# Automaton for the most recent keyword tuple, reused while the same
+# (immutable) tuple object is passed in, as prepare_articles does per refresh
+_last_automaton = (None, None)
+
+
+def _highlight_automaton(keywords):
+    """Return the automaton for keywords without rehashing a known tuple"""
+    global _last_automaton
+
+    cached_keywords, automaton = _last_automaton
+    if keywords is cached_keywords:
+        return automaton
+    automaton = build_keyword_automaton(tuple(keywords))
+    if isinstance(keywords, tuple):
+        _last_automaton = (keywords, automaton)
+    return automaton
+
+
+def _keyword_spans(text, automaton):
+    """Return sorted, non-overlapping (start, end) spans of keyword matches"""
+    # Single pass over the text: keep the longest keyword starting at each index.
+    # Word boundary at start avoids matching inside words (like \b in a regex)
+    text_lower = _lower_keep_offsets(text)
+    longest_at = {}
+    for end_index, (length, starts_with_word) in automaton.iter(text_lower):
+        start = end_index - length + 1
+        before = is_word_char(text_lower[start - 1]) if start > 0 else False
+        if before == starts_with_word:
+            continue
+        if length > longest_at.get(start, 0):
+            longest_at[start] = length
+
+    # Leftmost match wins; extend it through any word suffix (e.g. cyberhot
+    # matches cyberhoten, cyberhotet, etc.) and drop matches it overlaps
+    spans = []
+    position = 0
+    text_length = len(text)
+    for start in sorted(longest_at):
+        if start < position:
+            continue
+        end = start + longest_at[start]
+        while end < text_length and is_word_char(text[end]):
+            end += 1
+        spans.append((start, end))
+        position = end
+    return spans
+
+
 def highlight_keywords(text, keywords):
     """Highlight matching keywords in text with HTML"""
     if not text:
         return text
 
-    # Sort keywords by length (longest first) to match longer phrases first
-    sorted_keywords = sorted(keywords, key=len, reverse=True)
-
-    # Use placeholders to prevent nested highlighting
-    highlighted = text
-    placeholder_counter = [0]  # Use list to allow modification in nested function
-    replacements = {}
-
-    for keyword in sorted_keywords:
-        # Use word boundary at start to avoid matching inside words
-        # But allow any suffix (e.g., cyberhot matches cyberhoten, cyberhotet, etc.)
-        pattern = re.compile(r"\b(" + re.escape(keyword) + r"\w*)", re.IGNORECASE)
+    automaton = _highlight_automaton(keywords)
+    if automaton is None:
+        return escape(text)
 
-        def replace_with_placeholder(match):
-            # Create unique placeholder that won't match any keyword
-            placeholder = f"\x00HIGHLIGHT_{placeholder_counter[0]}\x00"
-            replacements[placeholder] = (
-                f'<mark class="highlight">{match.group(1)}</mark>'
-            )
-            placeholder_counter[0] += 1
-            return placeholder
+    # Most texts contain no keyword at all
+    spans = _keyword_spans(text, automaton)
+    if not spans:
+        return escape(text)
 
-        highlighted = pattern.sub(replace_with_placeholder, highlighted)
+    # Rebuild the text once, left to right; feed text is escaped since the
+    # result is rendered as HTML
+    parts = []
+    position = 0
+    for start, end in spans:
+        parts.append(escape(text[position:start]))
+        parts.append(f'<mark class="highlight">{escape(text[start:end])}</mark>')
+        position = end
+    parts.append(escape(text[position:]))
 
-    # Replace all placeholders with actual HTML
-    for placeholder, html in replacements.items():
-        highlighted = highlighted.replace(placeholder, html)
+    return Markup("".join(parts))
 
-    return Markup(highlighted)
 
-
-# Cache for articles
+# Cache for articles (display fields are precomputed when the cache is updated).
+# Writers rebind these globals to new objects, so readers need no lock.
 articles_cache = []
 last_update = None
-update_lock = threading.Lock()
-
-
-def update_articles():
-    """Background task to update articles periodically"""
-    global articles_cache, last_update
-
-    while True:
-        try:
-            print(f"Updating articles at {datetime.now()}")
-            new_articles = scrape_all_sites()
-
-            with update_lock:
-                articles_cache = new_articles
-                last_update = datetime.now()
-
-            print(f"Found {len(new_articles)} articles")
-        except Exception as e:
-            print(f"Error updating articles: {e}")
-
-        # Wait 30 minutes before next update
-        time.sleep(30 * 60)
-
-
-@app.route("/")
-def index():
-    """Render the main page"""
-    with update_lock:
-        articles = articles_cache.copy()
-        updated = last_update
-
-    # Load keywords for highlighting
-    all_keywords = load_keywords()
-    apt_keywords = load_apt_keywords()
-    combined_keywords = list(set(all_keywords + apt_keywords))  # Remove duplicates
-
-    # Format timestamps and extract domains for display
+# Positions of the articles shown in each tab; holds the list it indexes so
+# both are swapped together
+article_index_cache: Dict[str, list] = {
+    "articles": [],
+    "apt_swedish": [],
+    "apt_other": [],
+    "swedish": [],
+    "international": [],
+}
+
+# Background event loop running the periodic update; it owns the shared
+# aiohttp session so the connection pool is reused across refreshes
+_background_loop = None
+_http_session = None
+
+
+def prepare_articles(articles, keywords):
+    """Add display fields (timestamp, domain, highlighted text) to articles"""
     for article in articles:
         if article.get("timestamp"):
             parsed = parse_timestamp(article["timestamp"])
@@ -115,34 +152,123 @@ def index():
 
         # Highlight keywords in title and ingress
         article["title_highlighted"] = highlight_keywords(
-            article.get("title", ""), combined_keywords
+            article.get("title", ""), keywords
         )
         article["ingress_highlighted"] = highlight_keywords(
-            article.get("ingress", ""), combined_keywords
+            article.get("ingress", ""), keywords
         )
         article["summary_highlighted"] = highlight_keywords(
-            article.get("summary", ""), combined_keywords
+            article.get("summary", ""), keywords
         )
 
-    # Separate articles by category and APT
-    # APT articles appear in both their original category AND the APT tab
-    # EXCEPT for apt_only category which only appears in APT tab
-    apt_articles = [a for a in articles if a.get("is_apt")]
+    return articles
 
-    # Sort APT articles: Swedish references first, then others
-    # Within each group, maintain timestamp order
-    apt_swedish = [a for a in apt_articles if a.get("is_swedish_reference")]
-    apt_other = [a for a in apt_articles if not a.get("is_swedish_reference")]
-    apt_articles = apt_swedish + apt_other
 
-    swedish_articles = [
-        a for a in articles
-        if a.get("category") == "swedish"
-    ]
-    international_articles = [
-        a for a in articles
-        if a.get("category") == "international"
-    ]
+async def load_articles(session=None):
+    """Scrape all sites and prepare the articles for display"""
+    all_keywords, apt_keywords = load_all_keywords()
+    # Dedupe and keep longest first, like the loaded keyword lists
+    combined_keywords = tuple(
+        sorted(dict.fromkeys(all_keywords + apt_keywords), key=len, reverse=True)
+    )
+    articles = await scrape_all_sites_async(all_keywords, apt_keywords, session)
+    return prepare_articles(articles, combined_keywords)
+
+
+async def _load_articles_shared():
+    """Load articles with the background loop's shared session"""
+    return await load_articles(_http_session)
+
+
+def build_article_index(articles):
+    """Precompute the positions of the articles shown in each tab"""
+    article_index = {
+        "articles": articles,
+        "apt_swedish": [],
+        "apt_other": [],
+        "swedish": [],
+        "international": [],
+    }
+    for position, article in enumerate(articles):
+        # APT articles appear in both their original category AND the APT tab
+        # (Swedish references first), EXCEPT for apt_only category which only
+        # appears in APT tab
+        if article.get("is_apt"):
+            if article.get("is_swedish_reference"):
+                article_index["apt_swedish"].append(position)
+            else:
+                article_index["apt_other"].append(position)
+
+        category = article.get("category")
+        if category in ("swedish", "international"):
+            article_index[category].append(position)
+
+    return article_index
+
+
+def _publish_articles(new_articles):
+    """Swap in freshly loaded articles"""
+    global articles_cache, article_index_cache, last_update
+
+    article_index_cache = build_article_index(new_articles)
+    articles_cache = new_articles
+    last_update = datetime.now()
+
+
+async def update_articles():
+    """Background task to update articles periodically"""
+    global _http_session
+
+    _http_session = create_session()
+    while True:
+        # Wait 30 minutes before next update
+        await asyncio.sleep(30 * 60)
+
+        try:
+            print(f"Updating articles at {datetime.now()}")
+            new_articles = await _load_articles_shared()
+            _publish_articles(new_articles)
+            print(f"Found {len(new_articles)} articles")
+        except Exception as e:
+            print(f"Error updating articles: {e}")
+
+
+def start_background_loop():
+    """Start the event loop running update_articles in a daemon thread"""
+    global _background_loop
+
+    _background_loop = asyncio.new_event_loop()
+    _background_loop.create_task(update_articles())
+    threading.Thread(target=_background_loop.run_forever, daemon=True).start()
+
+
+def refresh_articles():
+    """Load and publish articles, on the background loop if it is running"""
+    if _background_loop is not None:
+        future = asyncio.run_coroutine_threadsafe(
+            _load_articles_shared(), _background_loop
+        )
+        new_articles = future.result()
+    else:
+        new_articles = asyncio.run(load_articles())
+
+    _publish_articles(new_articles)
+    return new_articles
+
+
+@app.route("/")
+def index():
+    """Render the main page"""
+    article_index = article_index_cache
+    articles = article_index["articles"]
+    updated = last_update
+
+    # Articles are already sorted into tabs when the cache is updated
+    apt_swedish = [articles[i] for i in article_index["apt_swedish"]]
+    apt_other = [articles[i] for i in article_index["apt_other"]]
+    apt_articles = apt_swedish + apt_other
+    swedish_articles = [articles[i] for i in article_index["swedish"]]
+    international_articles = [articles[i] for i in article_index["international"]]
 
     return render_template(
         "index.html",
@@ -162,9 +288,8 @@ def index():
 @app.route("/api/articles")
 def api_articles():
     """API endpoint to get articles as JSON"""
-    with update_lock:
-        articles = articles_cache.copy()
-        updated = last_update
+    articles = articles_cache
+    updated = last_update
 
     return jsonify(
         {
@@ -178,28 +303,19 @@ def api_articles():
 @app.route("/refresh")
 def refresh():
     """Manually trigger a refresh"""
-    global articles_cache, last_update
-
     try:
-        new_articles = scrape_all_sites()
-        with update_lock:
-            articles_cache = new_articles
-            last_update = datetime.now()
+        new_articles = refresh_articles()
         return jsonify({"status": "success", "count": len(new_articles)})
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
 if __name__ == "__main__":
-    # Initial load
+    # Start background update loop, then do the initial load on it
+    start_background_loop()
     print("Loading initial articles...")
-    articles_cache = scrape_all_sites()
-    last_update = datetime.now()
+    refresh_articles()
     print(f"Loaded {len(articles_cache)} articles")
 
-    # Start background update thread
-    update_thread = threading.Thread(target=update_articles, daemon=True)
-    update_thread.start()
-
     # Run Flask app
     app.run(debug=True, host="0.0.0.0", port=4711)
@@ -1,17 +1,85 @@
 import json
-import requests
+import asyncio
+import aiohttp
 from bs4 import BeautifulSoup
-from typing import List, Dict
+from typing import Any, List, Dict, Optional, Tuple
 import re
+import html
 from datetime import datetime
 from dateutil import parser as date_parser
-import xml.etree.ElementTree as ET
+from lxml import etree
+import lxml.html
 import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+import ahocorasick
+from cachetools import TTLCache
+from functools import lru_cache
 
 # Cache for keywords with file modification time
-_keywords_cache = {"keywords": None, "apt_keywords": None, "mtime": None}
+_keywords_cache: Dict[str, Any] = {
+    "keywords": None,
+    "apt_keywords": None,
+    "mtime": None,
+}
 _keywords_file = "keywords.txt"
 
+# HTTP settings for the shared aiohttp session
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+_TIMEOUT = aiohttp.ClientTimeout(total=10)
+_CONNECTION_POOL_SIZE = 20
+_MAX_CONCURRENT_REQUESTS = 10
+
+
+# Ingress cache - feeds are cumulative, so the same article links come back
+# every refresh. Fetched ingresses are kept for a day from when they were
+# fetched, in memory and on disk (so restarts don't refetch them); failed
+# fetches are not cached. Entries are (ingress, fetched_at).
+_INGRESS_CACHE_TTL = 24 * 3600
+_INGRESS_CACHE: TTLCache[str, Tuple[str, float]] = TTLCache(
+    maxsize=5000, ttl=_INGRESS_CACHE_TTL
+)
+_ingress_cache_file = "ingress_cache.sqlite3"
+_ingress_cache_lock = threading.Lock()
+_ingress_cache_loaded = False
+_pending_ingress: Dict[str, Tuple[str, float]] = {}
+
+# Text cleanup patterns
+_WS_RE = re.compile(r"\s+")
+# Only real tags (a letter, "/", "!" or "?" right after "<"), so text like
+# "<5 and >3" survives
+_TAG_RE = re.compile(r"<[A-Za-z/!?][^>]*>")
+# Fragments the regex can't strip: comments may contain ">", and script/style
+# bodies are not text
+_NEEDS_HTML_PARSER_RE = re.compile(r"<!--|<(?:script|style)\b", re.IGNORECASE)
+_HTML_PARSER = lxml.html.HTMLParser(remove_comments=True)
+
+# Feed parsing: one shared XML parser and precompiled XPath lookups.
+# Child lookups return matches in document order, like iterating the children.
+_XML_PARSER = etree.XMLParser(
+    resolve_entities=False, no_network=True, remove_comments=True, remove_pis=True
+)
+_FEED_NAMESPACES = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "content": "http://purl.org/rss/1.0/modules/content/",
+    "dc": "http://purl.org/dc/elements/1.1/",
+}
+_RSS_ITEMS_XP = etree.XPath(".//item")
+_ATOM_ENTRIES_XP = etree.XPath(".//atom:entry", namespaces=_FEED_NAMESPACES)
+_TITLE_XP = etree.XPath("title|atom:title", namespaces=_FEED_NAMESPACES)
+_LINK_XP = etree.XPath("link|atom:link", namespaces=_FEED_NAMESPACES)
+_DESCRIPTION_XP = etree.XPath(
+    "description|content:encoded|atom:summary|atom:content",
+    namespaces=_FEED_NAMESPACES,
+)
+_TIMESTAMP_XP = etree.XPath(
+    "pubDate|dc:date|atom:published|atom:updated", namespaces=_FEED_NAMESPACES
+)
+
 
 def load_config():
     """Load site configuration from config.json"""
@@ -19,114 +87,195 @@ def load_config():
         return json.load(f)
 
 
-def _check_keywords_cache():
-    """Check if keywords cache is valid or needs reload"""
+def _keywords_mtime():
+    """Return the modification time of keywords.txt (None if unavailable)"""
     try:
-        current_mtime = os.path.getmtime(_keywords_file)
-        if (
-            _keywords_cache["mtime"] is None
-            or current_mtime != _keywords_cache["mtime"]
-        ):
-            # File changed, need to reload
-            return False
-        return True
-    except Exception:
-        return False
-
-
-def load_keywords():
-    """Load keywords from keywords.txt (with hot-reload on file change)"""
-    if _check_keywords_cache() and _keywords_cache["keywords"] is not None:
-        return _keywords_cache["keywords"]
-
-    # Reload keywords
+        return os.path.getmtime(_keywords_file)
+    except OSError:
+        return None
+
+
+def load_all_keywords() -> Tuple[List[str], List[str]]:
+    """Load general and APT keywords from keywords.txt (with hot-reload on file change)
+
+    The file is stat'ed once per call and parsed in a single pass on change.
+    """
+    current_mtime = _keywords_mtime()
+    if (
+        current_mtime is not None
+        and current_mtime == _keywords_cache["mtime"]
+        and _keywords_cache["keywords"] is not None
+    ):
+        return _keywords_cache["keywords"], _keywords_cache["apt_keywords"]
+
+    # Reload keywords - every non-comment line is a general keyword, and the
+    # lines under "# APT Groups" (until a non-APT section) are APT keywords
+    keywords = []
+    apt_keywords = []
+    apt_section = False
+    apt_done = False
     with open(_keywords_file, "r") as f:
-        keywords = [
-            line.strip().lower()
-            for line in f
-            if line.strip() and not line.strip().startswith("#")
-        ]
+        for line in f:
+            line = line.strip()
+            if not apt_done:
+                if line.startswith("# APT Groups"):
+                    apt_section = True
+                elif apt_section and line.startswith("#") and "APT" not in line:
+                    apt_section = False
+                    apt_done = True
+            if line and not line.startswith("#"):
+                keyword = line.lower()
+                keywords.append(keyword)
+                if apt_section:
+                    apt_keywords.append(keyword)
+
+    # Sort once here (longest first, file order within a length) so callers
+    # never need to re-sort per call
+    keywords.sort(key=len, reverse=True)
+    apt_keywords.sort(key=len, reverse=True)
 
     # Update cache
     _keywords_cache["keywords"] = keywords
-    _keywords_cache["mtime"] = os.path.getmtime(_keywords_file)
+    _keywords_cache["apt_keywords"] = apt_keywords
+    _keywords_cache["mtime"] = current_mtime
 
     print(f"✓ Reloaded {len(keywords)} keywords from {_keywords_file}")
-    return keywords
+    print(f"✓ Reloaded {len(apt_keywords)} APT keywords from {_keywords_file}")
+    return keywords, apt_keywords
+
+
+def load_keywords():
+    """Load keywords from keywords.txt (with hot-reload on file change)"""
+    return load_all_keywords()[0]
 
 
 def load_apt_keywords():
     """Load APT-specific keywords from keywords.txt (with hot-reload on file change)"""
-    if _check_keywords_cache() and _keywords_cache["apt_keywords"] is not None:
-        return _keywords_cache["apt_keywords"]
+    return load_all_keywords()[1]
 
-    # Reload APT keywords
-    with open(_keywords_file, "r") as f:
-        lines = f.readlines()
-        apt_section = False
-        apt_keywords = []
-        for line in lines:
-            line = line.strip()
-            if line.startswith("# APT Groups"):
-                apt_section = True
-                continue
-            if apt_section:
-                if line.startswith("#") and "APT" not in line:
-                    break
-                if line and not line.startswith("#"):
-                    apt_keywords.append(line.lower())
 
-    # Update cache
-    _keywords_cache["apt_keywords"] = apt_keywords
-    _keywords_cache["mtime"] = os.path.getmtime(_keywords_file)
+def is_word_char(char: str) -> bool:
+    """Return True if char counts as a regex \\w character"""
+    return char.isalnum() or char == "_"
 
-    print(f"✓ Reloaded {len(apt_keywords)} APT keywords from {_keywords_file}")
-    return apt_keywords
 
+@lru_cache(maxsize=32)
+def build_keyword_automaton(
+    keywords: Tuple[str, ...],
+) -> Optional[ahocorasick.Automaton]:
+    """Build an Aho-Corasick automaton for a keyword set (None if it is empty)
 
-def match_keywords(text: str, keywords: List[str]) -> bool:
-    """Check if text contains any of the keywords (with word boundary at start, allows suffixes)"""
-    text_lower = text.lower()
+    Each keyword maps to (length, whether it starts with a word character), so
+    matchers can check the word boundary before a hit.
+    """
+    automaton = ahocorasick.Automaton()
     for keyword in keywords:
-        # Use word boundary at start to avoid matching inside words
-        # But allow any suffix (e.g., cyberhot matches cyberhoten, cyberhoten, etc.)
-        pattern = r"\b" + re.escape(keyword.lower())
-        if re.search(pattern, text_lower):
+        keyword = keyword.lower()
+        if keyword:
+            automaton.add_word(keyword, (len(keyword), is_word_char(keyword[0])))
+    if len(automaton) == 0:
+        return None
+    automaton.make_automaton()
+    return automaton
+
+
+def _match_keywords_lower(text_lower: str, keywords: List[str]) -> bool:
+    """match_keywords for text that is already lowercased"""
+    automaton = build_keyword_automaton(tuple(keywords))
+    if automaton is None:
+        return False
+
+    # One scan for all keywords. Word boundary at start avoids matching inside
+    # words, but any suffix is allowed (e.g., cyberhot matches cyberhoten,
+    # cyberhotet, etc.)
+    for end_index, (length, starts_with_word) in automaton.iter(text_lower):
+        start = end_index - length + 1
+        before = is_word_char(text_lower[start - 1]) if start > 0 else False
+        if before != starts_with_word:
             return True
     return False
 
 
-def detect_swedish_reference(text: str) -> bool:
-    """Detect if article mentions Swedish references (companies, cities, country)"""
-    text_lower = text.lower()
-
-    # Swedish indicators
-    swedish_keywords = [
-        # Country names
-        "sweden", "sverige", "swedish",
-        # Major cities
-        "stockholm", "göteborg", "gothenburg", "malmö", "malmo", "uppsala", "västerås", "vasteras",
-        "örebro", "orebro", "linköping", "linkoping", "helsingborg", "jönköping", "jonkoping",
-        "norrköping", "norrkoping", "lund", "umeå", "umea", "gävle", "gavle", "borås", "boras",
-        # Swedish domains
-        ".se",
-        # Common Swedish companies/organizations
-        "volvo", "ericsson", "ikea", "h&m", "spotify", "klarna", "skanska", "sca", "astrazeneca",
-        "nordea", "seb bank", "swedbank", "handelsbanken", "telia", "telenor", "scania",
-        # Government/Organizations
-        "swedish government", "regeringen", "försvarsmakten", "forsvaret", "polisen",
-        "msb", "cert-se", "säpo", "sapo", "försäkringskassan", "forsakringskassan",
-        "skatteverket", "arbetsförmedlingen", "arbetsformedlingen",
-    ]
+def match_keywords(text: str, keywords: List[str]) -> bool:
+    """Check if text contains any of the keywords (with word boundary at start, allows suffixes)"""
+    return _match_keywords_lower(text.lower(), keywords)
+
+
+# Swedish indicators (hand-wrapped by group, so black leaves them alone)
+# fmt: off
+SWEDISH_KEYWORDS = [
+    # Country names
+    "sweden", "sverige", "swedish",
+    # Major cities
+    "stockholm", "göteborg", "gothenburg", "malmö", "malmo", "uppsala", "västerås", "vasteras",
+    "örebro", "orebro", "linköping", "linkoping", "helsingborg", "jönköping", "jonkoping",
+    "norrköping", "norrkoping", "lund", "umeå", "umea", "gävle", "gavle", "borås", "boras",
+    # Swedish domains
+    ".se",
+    # Common Swedish companies/organizations
+    "volvo", "ericsson", "ikea", "h&m", "spotify", "klarna", "skanska", "sca", "astrazeneca",
+    "nordea", "seb bank", "swedbank", "handelsbanken", "telia", "telenor", "scania",
+    # Government/Organizations
+    "swedish government", "regeringen", "försvarsmakten", "forsvaret", "polisen",
+    "msb", "cert-se", "säpo", "sapo", "försäkringskassan", "forsakringskassan",
+    "skatteverket", "arbetsförmedlingen", "arbetsformedlingen",
+]
+# fmt: on
+
+
+# Indicators split by how they are matched: domain suffixes like ".se" count
+# when they follow a word character (e.g. "example.se"), everything else
+# (single words and multiword phrases) must start at a word boundary
+SWEDISH_TLD_MARKERS = [k for k in SWEDISH_KEYWORDS if k.startswith(".")]
+SWEDISH_PHRASE_KEYWORDS = [k for k in SWEDISH_KEYWORDS if " " in k]
+SWEDISH_WORD_KEYWORDS = [
+    k
+    for k in SWEDISH_KEYWORDS
+    if k not in SWEDISH_TLD_MARKERS and k not in SWEDISH_PHRASE_KEYWORDS
+]
+
+
+def _build_swedish_automaton() -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton over the Swedish word and phrase keywords"""
+    automaton = ahocorasick.Automaton()
+    for keyword in SWEDISH_WORD_KEYWORDS + SWEDISH_PHRASE_KEYWORDS:
+        automaton.add_word(keyword, len(keyword))
+    automaton.make_automaton()
+    return automaton
+
+
+_SWEDISH_AC = _build_swedish_automaton()
+
+
+def _has_swedish_tld(text_lower: str) -> bool:
+    """Check for a Swedish domain suffix directly after a word character"""
+    for marker in SWEDISH_TLD_MARKERS:
+        index = text_lower.find(marker, 1)
+        while index != -1:
+            if is_word_char(text_lower[index - 1]):
+                return True
+            index = text_lower.find(marker, index + 1)
+    return False
 
-    for keyword in swedish_keywords:
-        pattern = r"\b" + re.escape(keyword.lower())
-        if re.search(pattern, text_lower):
-            return True
 
+def _detect_swedish_reference_lower(text_lower: str) -> bool:
+    """detect_swedish_reference for text that is already lowercased"""
+    # Cheap substring checks for domains first, then one automaton scan for
+    # all words and phrases; a hit counts if no word character precedes it
+    if _has_swedish_tld(text_lower):
+        return True
+    for end_index, length in _SWEDISH_AC.iter(text_lower):
+        start = end_index - length + 1
+        if start == 0 or not is_word_char(text_lower[start - 1]):
+            return True
     return False
 
 
+def detect_swedish_reference(text: str) -> bool:
+    """Detect if article mentions Swedish references (companies, cities, country)"""
+    return _detect_swedish_reference_lower(text.lower())
+
+
 def generate_summary(text: str, max_length: int = 150) -> str:
     """Generate a short summary from text"""
     text = text.strip()
@@ -135,213 +284,328 @@ def generate_summary(text: str, max_length: int = 150) -> str:
     return text[:max_length].rsplit(" ", 1)[0] + "..."
 
 
-def fetch_article_ingress(url: str, ingress_selector: str) -> str:
-    """Fetch the ingress/lead paragraph from an article page"""
-    try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
-        response = requests.get(url, headers=headers, timeout=10)
+async def _fetch(
+    session: aiohttp.ClientSession, url: str
+) -> Tuple[bytes, Optional[str]]:
+    """Download a URL and return the raw body and its declared charset"""
+    async with session.get(url) as response:
         response.raise_for_status()
+        return await response.read(), response.charset
 
-        soup = BeautifulSoup(response.content, "html.parser")
-        ingress_elem = soup.select_one(ingress_selector)
 
-        if ingress_elem:
-            ingress_text = ingress_elem.get_text(strip=True)
-            # Clean up the text
-            ingress_text = re.sub(r"\s+", " ", ingress_text)
-            return ingress_text
-        return ""
+def _make_soup(content: bytes, encoding: Optional[str]) -> BeautifulSoup:
+    """Parse an HTML page with the lxml backend
+
+    A charset declared by the server is passed on so BeautifulSoup skips
+    encoding detection; otherwise it falls back to the page's <meta> tag.
+    """
+    return BeautifulSoup(content, "lxml", from_encoding=encoding)
+
+
+def _extract_ingress(
+    content: bytes, ingress_selector: str, encoding: Optional[str] = None
+) -> str:
+    """Extract the ingress/lead paragraph from a downloaded article page"""
+    soup = _make_soup(content, encoding)
+    ingress_elem = soup.select_one(ingress_selector)
+
+    if ingress_elem:
+        ingress_text = ingress_elem.get_text(strip=True)
+        # Clean up the text
+        ingress_text = _WS_RE.sub(" ", ingress_text)
+        return ingress_text
+    return ""
+
+
+def _open_ingress_db() -> sqlite3.Connection:
+    """Open the on-disk ingress cache, creating its table if needed"""
+    conn = sqlite3.connect(_ingress_cache_file)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS ingress "
+        "(url TEXT PRIMARY KEY, ingress TEXT NOT NULL, fetched_at REAL NOT NULL)"
+    )
+    return conn
+
+
+def _get_cached_ingress(url: str) -> Optional[str]:
+    """Return the cached ingress for url (loading the disk cache on first use)"""
+    global _ingress_cache_loaded
+
+    with _ingress_cache_lock:
+        if not _ingress_cache_loaded:
+            _ingress_cache_loaded = True
+            try:
+                # Load the newest rows, oldest first so they are evicted first
+                with closing(_open_ingress_db()) as conn:
+                    rows = conn.execute(
+                        "SELECT url, ingress, fetched_at FROM ingress "
+                        "WHERE fetched_at > ? ORDER BY fetched_at DESC LIMIT ?",
+                        (time.time() - _INGRESS_CACHE_TTL, _INGRESS_CACHE.maxsize),
+                    ).fetchall()
+                for cached_url, ingress, fetched_at in reversed(rows):
+                    _INGRESS_CACHE[cached_url] = (ingress, fetched_at)
+            except sqlite3.Error as e:
+                print(f"Error loading ingress cache from {_ingress_cache_file}: {e}")
+
+        entry = _INGRESS_CACHE.get(url)
+        if entry is None:
+            return None
+        # Rows loaded from disk expire by when they were fetched, not loaded
+        ingress, fetched_at = entry
+        if time.time() - fetched_at >= _INGRESS_CACHE_TTL:
+            del _INGRESS_CACHE[url]
+            return None
+        return ingress
+
+
+def _cache_ingress(url: str, ingress: str):
+    """Remember a fetched ingress (written to disk by flush_ingress_cache)"""
+    with _ingress_cache_lock:
+        entry = (ingress, time.time())
+        _INGRESS_CACHE[url] = entry
+        _pending_ingress[url] = entry
+
+
+def flush_ingress_cache():
+    """Write newly fetched ingresses to disk and drop expired ones"""
+    with _ingress_cache_lock:
+        if not _pending_ingress:
+            return
+        entries = [
+            (url, ingress, fetched_at)
+            for url, (ingress, fetched_at) in _pending_ingress.items()
+        ]
+        _pending_ingress.clear()
+
+    try:
+        with closing(_open_ingress_db()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO ingress (url, ingress, fetched_at) "
+                "VALUES (?, ?, ?)",
+                entries,
+            )
+            conn.execute(
+                "DELETE FROM ingress WHERE fetched_at <= ?",
+                (time.time() - _INGRESS_CACHE_TTL,),
+            )
+    except sqlite3.Error as e:
+        print(f"Error saving ingress cache to {_ingress_cache_file}: {e}")
+
+
+async def fetch_article_ingress_async(
+    session: aiohttp.ClientSession, url: str, ingress_selector: str
+) -> str:
+    """Fetch the ingress/lead paragraph from an article page (async)
+
+    Call flush_ingress_cache() afterwards to persist newly fetched ingresses.
+    """
+    cached = _get_cached_ingress(url)
+    if cached is not None:
+        return cached
+
+    try:
+        content, encoding = await _fetch(session, url)
+        ingress = _extract_ingress(content, ingress_selector, encoding)
     except Exception as e:
         print(f"Error fetching ingress from {url}: {e}")
         return ""
 
+    _cache_ingress(url, ingress)
+    return ingress
 
-def scrape_rss_feed(site_config: Dict) -> List[Dict]:
-    """Scrape a single news site via RSS feed"""
-    articles = []
 
-    try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
-        response = requests.get(site_config["rss_url"], headers=headers, timeout=10)
-        response.raise_for_status()
+def _element_text(element) -> str:
+    """Concatenate all text inside an XML element"""
+    return "".join(element.itertext())
 
-        # Parse RSS feed
-        root = ET.fromstring(response.content)
 
-        # Handle both RSS and Atom feeds
-        # RSS uses <item> elements, Atom uses <entry>
-        items = list(
-            root.findall(".//item")
-            or root.findall(".//{http://www.w3.org/2005/Atom}entry")
+def _strip_html(text: str) -> str:
+    """Return the plain text content of an HTML fragment"""
+    # Removing tags with a regex is enough unless the fragment has comments or
+    # script/style elements (CDATA sections are already unwrapped by the XML
+    # parser); only those go through the shared lxml HTML parser
+    if not _NEEDS_HTML_PARSER_RE.search(text):
+        return html.unescape(_TAG_RE.sub("", text)).strip()
+    try:
+        fragment = lxml.html.fragment_fromstring(
+            text, create_parent="div", parser=_HTML_PARSER
         )
+        for element in list(fragment.iter("script", "style")):
+            element.drop_tree()
+        return fragment.text_content().strip()
+    except (etree.ParserError, ValueError):
+        return text.strip()
 
-        for item in items[:50]:  # Limit to 50 articles per site
-            try:
-                # Extract title - use direct iteration to avoid XML namespace issues
-                title = None
-                for child in item:
-                    if (
-                        child.tag == "title"
-                        or child.tag == "{http://www.w3.org/2005/Atom}title"
-                    ):
-                        title = "".join(child.itertext()).strip()
-                        break
-
-                # Extract link
-                link = None
-                for child in item:
-                    if (
-                        child.tag == "link"
-                        or child.tag == "{http://www.w3.org/2005/Atom}link"
-                    ):
-                        if child.text:
-                            link = child.text.strip()
-                        else:
-                            link = child.get("href", "").strip()
-                        break
-
-                # Extract description/summary for ingress
-                description = None
-                for child in item:
-                    if child.tag in [
-                        "description",
-                        "{http://purl.org/rss/1.0/modules/content/}encoded",
-                        "{http://www.w3.org/2005/Atom}summary",
-                        "{http://www.w3.org/2005/Atom}content",
-                    ]:
-                        desc_text = "".join(child.itertext())
-                        if desc_text and desc_text.strip():
-                            # Strip HTML tags from description
-                            # Only parse if it contains HTML-like content
-                            if "<" in desc_text and ">" in desc_text:
-                                description = BeautifulSoup(
-                                    desc_text, "html.parser"
-                                ).get_text(strip=True)
-                            else:
-                                description = desc_text.strip()
-                            # Limit length
-                            if len(description) > 300:
-                                description = (
-                                    description[:300].rsplit(" ", 1)[0] + "..."
-                                )
-                        break
-
-                # Extract timestamp - use direct iteration like title/link
-                timestamp = None
-                for child in item:
-                    if child.tag in [
-                        "pubDate",
-                        "{http://purl.org/dc/elements/1.1/}date",
-                        "{http://www.w3.org/2005/Atom}published",
-                        "{http://www.w3.org/2005/Atom}updated",
-                    ]:
-                        timestamp = "".join(child.itertext()).strip()
-                        break
-
-                if title and link:
-                    articles.append(
-                        {
-                            "title": title,
-                            "link": link,
-                            "origin": site_config["name"],
-                            "origin_url": site_config["url"],
-                            "timestamp": timestamp,
-                            "category": site_config.get("category", "international"),
-                            "ingress": description or "",
-                            "ingress_selector": "",  # Not needed for RSS
-                        }
-                    )
-            except Exception as e:
-                print(f"Error parsing RSS item from {site_config['name']}: {e}")
-                continue
 
-    except Exception as e:
-        print(f"Error scraping RSS feed {site_config['name']}: {e}")
+def _parse_rss_feed(content: bytes, site_config: Dict) -> List[Dict]:
+    """Parse a downloaded RSS/Atom feed into article dicts"""
+    articles = []
+
+    # Parse RSS feed
+    root = etree.fromstring(content, parser=_XML_PARSER)
+
+    # Handle both RSS and Atom feeds
+    # RSS uses <item> elements, Atom uses <entry>
+    items = _RSS_ITEMS_XP(root) or _ATOM_ENTRIES_XP(root)
+
+    for item in items[:50]:  # Limit to 50 articles per site
+        try:
+            # Extract title
+            title = None
+            title_elems = _TITLE_XP(item)
+            if title_elems:
+                title = _element_text(title_elems[0]).strip()
+
+            # Extract link
+            link = None
+            link_elems = _LINK_XP(item)
+            if link_elems:
+                if link_elems[0].text:
+                    link = link_elems[0].text.strip()
+                else:
+                    link = link_elems[0].get("href", "").strip()
+
+            # Extract description/summary for ingress
+            description = None
+            description_elems = _DESCRIPTION_XP(item)
+            if description_elems:
+                desc_text = _element_text(description_elems[0])
+                if desc_text and desc_text.strip():
+                    # Strip HTML tags from description
+                    # Only parse if it contains HTML-like content
+                    if "<" in desc_text and ">" in desc_text:
+                        description = _strip_html(desc_text)
+                    else:
+                        description = desc_text.strip()
+                    description = _WS_RE.sub(" ", description)
+                    # Limit length
+                    if len(description) > 300:
+                        description = description[:300].rsplit(" ", 1)[0] + "..."
+
+            # Extract timestamp
+            timestamp = None
+            timestamp_elems = _TIMESTAMP_XP(item)
+            if timestamp_elems:
+                timestamp = _element_text(timestamp_elems[0]).strip()
+
+            if title and link:
+                articles.append(
+                    {
+                        "title": title,
+                        "link": link,
+                        "origin": site_config["name"],
+                        "origin_url": site_config["url"],
+                        "timestamp": timestamp,
+                        "category": site_config.get("category", "international"),
+                        "ingress": description or "",
+                        "ingress_selector": "",  # Not needed for RSS
+                    }
+                )
+        except Exception as e:
+            print(f"Error parsing RSS item from {site_config['name']}: {e}")
+            continue
 
     return articles
 
 
-def scrape_site(site_config: Dict) -> List[Dict]:
-    """Scrape a single news site based on configuration"""
-    # If RSS feed URL is provided, use RSS scraping instead
-    if "rss_url" in site_config and site_config["rss_url"]:
-        return scrape_rss_feed(site_config)
+async def scrape_rss_feed_async(
+    session: aiohttp.ClientSession, site_config: Dict
+) -> List[Dict]:
+    """Scrape a single news site via RSS feed (async)"""
+    try:
+        content, _ = await _fetch(session, site_config["rss_url"])
+        return _parse_rss_feed(content, site_config)
+    except Exception as e:
+        print(f"Error scraping RSS feed {site_config['name']}: {e}")
+        return []
 
-    # Otherwise fall back to HTML scraping
+
+def _parse_site(
+    content: bytes, site_config: Dict, encoding: Optional[str] = None
+) -> List[Dict]:
+    """Parse a downloaded HTML front page into article dicts using CSS selectors"""
     articles = []
 
-    try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
-        response = requests.get(site_config["url"], headers=headers, timeout=10)
-        response.raise_for_status()
+    soup = _make_soup(content, encoding)
+    selectors = site_config["selectors"]
 
-        soup = BeautifulSoup(response.content, "html.parser")
-        selectors = site_config["selectors"]
+    article_elements = soup.select(selectors["articles"])
 
-        article_elements = soup.select(selectors["articles"])
+    for article_elem in article_elements[:50]:  # Limit to 50 articles per site
+        try:
+            title_elem = article_elem.select_one(selectors["title"])
+            link_elem = article_elem.select_one(selectors["link"])
 
-        for article_elem in article_elements[:50]:  # Limit to 50 articles per site
-            try:
-                title_elem = article_elem.select_one(selectors["title"])
-                link_elem = article_elem.select_one(selectors["link"])
-
-                if title_elem and link_elem:
-                    title = title_elem.get_text(strip=True)
-                    link = link_elem.get("href", "")
-
-                    # Make relative URLs absolute
-                    if link and not link.startswith("http"):
-                        from urllib.parse import urljoin
-
-                        link = urljoin(site_config["url"], link)
-
-                    # Extract timestamp if available
-                    timestamp = None
-                    if "timestamp" in selectors:
-                        timestamp_elem = article_elem.select_one(selectors["timestamp"])
-                        if timestamp_elem:
-                            # Try to get datetime attribute first, then text
-                            timestamp = timestamp_elem.get(
-                                "datetime"
-                            ) or timestamp_elem.get_text(strip=True)
-
-                    # Store ingress selector for later use
-                    ingress_selector = selectors.get("ingress", "")
-
-                    articles.append(
-                        {
-                            "title": title,
-                            "link": link,
-                            "origin": site_config["name"],
-                            "origin_url": site_config["url"],
-                            "timestamp": timestamp,
-                            "category": site_config.get("category", "international"),
-                            "ingress_selector": ingress_selector,
-                        }
-                    )
-            except Exception as e:
-                continue
+            if title_elem and link_elem:
+                title = title_elem.get_text(strip=True)
+                link = link_elem.get("href", "")
 
-    except Exception as e:
-        print(f"Error scraping {site_config['name']}: {e}")
+                # Make relative URLs absolute
+                if link and not link.startswith("http"):
+                    from urllib.parse import urljoin
+
+                    link = urljoin(site_config["url"], link)
+
+                # Extract timestamp if available
+                timestamp = None
+                if "timestamp" in selectors:
+                    timestamp_elem = article_elem.select_one(selectors["timestamp"])
+                    if timestamp_elem:
+                        # Try to get datetime attribute first, then text
+                        timestamp = timestamp_elem.get(
+                            "datetime"
+                        ) or timestamp_elem.get_text(strip=True)
+
+                # Store ingress selector for later use
+                ingress_selector = selectors.get("ingress", "")
+
+                articles.append(
+                    {
+                        "title": title,
+                        "link": link,
+                        "origin": site_config["name"],
+                        "origin_url": site_config["url"],
+                        "timestamp": timestamp,
+                        "category": site_config.get("category", "international"),
+                        "ingress_selector": ingress_selector,
+                    }
+                )
+        except Exception as e:
+            continue
 
     return articles
 
 
+async def scrape_site_async(
+    session: aiohttp.ClientSession, site_config: Dict
+) -> List[Dict]:
+    """Scrape a single news site based on configuration (async)"""
+    # If RSS feed URL is provided, use RSS scraping instead
+    if "rss_url" in site_config and site_config["rss_url"]:
+        return await scrape_rss_feed_async(session, site_config)
+
+    # Otherwise fall back to HTML scraping
+    try:
+        content, encoding = await _fetch(session, site_config["url"])
+        return _parse_site(content, site_config, encoding)
+    except Exception as e:
+        print(f"Error scraping {site_config['name']}: {e}")
+        return []
+
+
+@lru_cache(maxsize=4096)
 def parse_timestamp(timestamp_str: str) -> datetime:
     """Try to parse a timestamp string into a datetime object"""
     if not timestamp_str:
         return datetime.min
 
     try:
-        # Try parsing ISO format or common date formats
-        parsed = date_parser.parse(timestamp_str)
+        # Fast path for ISO 8601 (C-implemented), fall back to dateutil for
+        # RFC 822 and other common date formats
+        try:
+            parsed = datetime.fromisoformat(timestamp_str)
+        except ValueError:
+            parsed = date_parser.parse(timestamp_str)
         # Remove timezone info to make all datetimes naive for comparison
         if parsed.tzinfo is not None:
             parsed = parsed.replace(tzinfo=None)
@@ -351,50 +615,106 @@ def parse_timestamp(timestamp_str: str) -> datetime:
         return datetime.min
 
 
-def scrape_all_sites() -> List[Dict]:
-    """Scrape all configured sites and filter by keywords"""
+def create_session() -> aiohttp.ClientSession:
+    """Create the shared aiohttp session (must be called inside a running event loop)"""
+    connector = aiohttp.TCPConnector(limit=_CONNECTION_POOL_SIZE)
+    return aiohttp.ClientSession(
+        connector=connector, headers=_HEADERS, timeout=_TIMEOUT
+    )
+
+
+async def scrape_all_sites_async(
+    keywords: Optional[List[str]] = None,
+    apt_keywords: Optional[List[str]] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> List[Dict]:
+    """Scrape all configured sites concurrently and filter by keywords
+
+    Pass a long-lived session to reuse its connection pool across scrapes;
+    otherwise a session is created for this scrape only.
+    """
+    if session is None:
+        async with create_session() as session:
+            return await scrape_all_sites_async(keywords, apt_keywords, session)
+
     config = load_config()
-    keywords = load_keywords()
-    apt_keywords = load_apt_keywords()
-    all_articles = []
+    if keywords is None or apt_keywords is None:
+        keywords, apt_keywords = load_all_keywords()
 
-    for site in config["sites"]:
-        articles = scrape_site(site)
-        all_articles.extend(articles)
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
 
-    # Filter by keywords
-    filtered_articles = []
+    async def limited(coro):
+        async with semaphore:
+            return await coro
+
+    # Fetch all sites at once
+    results = await asyncio.gather(
+        *(limited(scrape_site_async(session, site)) for site in config["sites"])
+    )
+    all_articles = [article for articles in results for article in articles]
+
+    # Filter by keywords - check both title and ingress for matches.
+    # Every copy of a link is matched (feeds differ in how much text they
+    # carry), and only the first matching copy is kept. Each article's text is
+    # lowercased once and reused for all checks
+    seen_links = set()
+    matched = []  # [article, lowercased title + ingress]
     for article in all_articles:
-        # Check both title and ingress for keyword matches
-        article_text = article["title"] + " " + article.get("ingress", "")
-
-        if match_keywords(article_text, keywords):
-            # If ingress not already set (from RSS), fetch from article page
-            if not article.get("ingress"):
-                if article.get("ingress_selector") and article.get("link"):
-                    article["ingress"] = fetch_article_ingress(
-                        article["link"], article["ingress_selector"]
-                    )
-                else:
-                    article["ingress"] = ""
+        text_lower = (article["title"] + " " + article.get("ingress", "")).lower()
+        if not _match_keywords_lower(text_lower, keywords):
+            continue
 
-            # Set summary fallback
-            article["summary"] = (
-                article["ingress"]
-                if article["ingress"]
-                else generate_summary(article["title"])
+        link = article.get("link")
+        if link:
+            if link in seen_links:
+                continue
+            seen_links.add(link)
+        matched.append([article, text_lower])
+
+    # If ingress not already set (from RSS), fetch all article pages at once
+    needs_ingress = [
+        entry
+        for entry in matched
+        if not entry[0].get("ingress")
+        and entry[0].get("ingress_selector")
+        and entry[0].get("link")
+    ]
+    ingresses = await asyncio.gather(
+        *(
+            limited(
+                fetch_article_ingress_async(
+                    session, article["link"], article["ingress_selector"]
+                )
             )
+            for article, _ in needs_ingress
+        )
+    )
+    for entry, ingress in zip(needs_ingress, ingresses):
+        entry[0]["ingress"] = ingress
+        entry[1] = (entry[0]["title"] + " " + ingress).lower()
+    flush_ingress_cache()
+
+    filtered_articles = []
+    for article, text_lower in matched:
+        if not article.get("ingress"):
+            article["ingress"] = ""
+
+        # Set summary fallback
+        article["summary"] = (
+            article["ingress"]
+            if article["ingress"]
+            else generate_summary(article["title"])
+        )
 
-            # Check if article is APT-related
-            article_text = (article["title"] + " " + article.get("ingress", "")).lower()
-            if match_keywords(article_text, apt_keywords):
-                article["is_apt"] = True
+        # Check if article is APT-related
+        if _match_keywords_lower(text_lower, apt_keywords):
+            article["is_apt"] = True
 
-            # Check for Swedish references (for ransomware.live and similar APT sources)
-            if detect_swedish_reference(article["title"] + " " + article.get("ingress", "")):
-                article["is_swedish_reference"] = True
+        # Check for Swedish references (for ransomware.live and similar APT sources)
+        if _detect_swedish_reference_lower(text_lower):
+            article["is_swedish_reference"] = True
 
-            filtered_articles.append(article)
+        filtered_articles.append(article)
 
     # Sort by timestamp, newest first
     filtered_articles.sort(
@@ -402,3 +722,10 @@ def scrape_all_sites() -> List[Dict]:
     )
 
     return filtered_articles
+
+
+def scrape_all_sites(
+    keywords: Optional[List[str]] = None, apt_keywords: Optional[List[str]] = None
+) -> List[Dict]:
+    """Scrape all configured sites and filter by keywords"""
+    return asyncio.run(scrape_all_sites_async(keywords, apt_keywords))
@@ -1,6 +1,6 @@
 """Integration test for highlighting in the full flow"""
-from scraper import scrape_all_sites
-from app import highlight_keywords, load_keywords, load_apt_keywords
+from scraper import scrape_all_sites, load_keywords, load_apt_keywords
+from app import highlight_keywords
 
 print("Testing full integration...")
 print("=" * 80)
@@ -1,15 +1,35 @@
 """Comprehensive test suite for the news aggregator"""
 
+import os
+import tempfile
 import unittest
-from unittest.mock import patch, Mock
+import asyncio
+import threading
+from unittest.mock import patch, Mock, AsyncMock
+from cachetools import TTLCache
+import app
 from scraper import (
     load_keywords,
     load_apt_keywords,
     parse_timestamp,
     match_keywords,
-    scrape_rss_feed,
+    detect_swedish_reference,
+    scrape_rss_feed_async,
+    scrape_site_async,
+    scrape_all_sites_async,
+    flush_ingress_cache,
+    _INGRESS_CACHE_TTL,
+    _cache_ingress,
+    _get_cached_ingress,
+    _strip_html,
+)
+from app import (
+    extract_domain,
+    highlight_keywords,
+    prepare_articles,
+    build_article_index,
+    refresh_articles,
 )
-from app import extract_domain, highlight_keywords
 from datetime import datetime
 
 
@@ -53,6 +73,11 @@ class TestTimestampParsing(unittest.TestCase):
         result = parse_timestamp(timestamp)
         self.assertNotEqual(result, datetime.min)
 
+    def test_parse_iso_timestamp_with_offset(self):
+        """Test ISO 8601 timestamps with an offset are returned naive"""
+        result = parse_timestamp("2025-11-27T10:30:00+01:00")
+        self.assertEqual(result, datetime(2025, 11, 27, 10, 30))
+
     def test_parse_invalid_timestamp(self):
         """Test invalid timestamp returns datetime.min"""
         timestamp = "invalid timestamp"
@@ -81,6 +106,27 @@ class TestKeywordMatching(unittest.TestCase):
         keywords = ["ransomware"]
         self.assertTrue(match_keywords(text, keywords))
 
+    def test_match_keywords_word_boundary(self):
+        """Test that keywords only match at the start of a word"""
+        keywords = ["mask"]
+        self.assertFalse(match_keywords("En ny pengamaskin", keywords))
+        self.assertTrue(match_keywords("En pengamaskin och en mask", keywords))
+
+
+class TestSwedishReference(unittest.TestCase):
+    """Test Swedish reference detection"""
+
+    def test_detect_swedish_reference_positive(self):
+        """Test that Swedish cities, companies and domains are detected"""
+        self.assertTrue(detect_swedish_reference("Attack against Malmö hospital"))
+        self.assertTrue(detect_swedish_reference("Volvo hit by ransomware"))
+        self.assertTrue(detect_swedish_reference("Leak found on example.se"))
+
+    def test_detect_swedish_reference_word_boundary(self):
+        """Test that indicators inside other words are not detected"""
+        self.assertFalse(detect_swedish_reference("Hackers target Islund users"))
+        self.assertFalse(detect_swedish_reference("Breach at .se registry"))
+
 
 class TestDomainExtraction(unittest.TestCase):
     """Test domain extraction functionality"""
@@ -137,6 +183,28 @@ class TestHighlighting(unittest.TestCase):
         # Should not highlight 'mask' inside 'maskin'
         self.assertNotIn('<mark class="highlight">mask</mark>in', str(result))
 
+    def test_highlight_suffix_match(self):
+        """Test that highlighting extends through word suffixes"""
+        text = "Nya cyberhoten mot Sverige"
+        keywords = ["cyberhot"]
+        result = highlight_keywords(text, keywords)
+        self.assertIn('<mark class="highlight">cyberhoten</mark>', str(result))
+
+    def test_highlight_escapes_html(self):
+        """Test that HTML in feed text is escaped, with or without matches"""
+        text = "<script>alert(1)</script> ransomware & <b>more</b>"
+        result = str(highlight_keywords(text, ["ransomware"]))
+        self.assertEqual(
+            result,
+            "&lt;script&gt;alert(1)&lt;/script&gt; "
+            '<mark class="highlight">ransomware</mark> '
+            "&amp; &lt;b&gt;more&lt;/b&gt;",
+        )
+        result = str(highlight_keywords("<script>alert(1)</script>", ["malware"]))
+        self.assertEqual(result, "&lt;script&gt;alert(1)&lt;/script&gt;")
+        result = str(highlight_keywords("<script>alert(1)</script>", []))
+        self.assertEqual(result, "&lt;script&gt;alert(1)&lt;/script&gt;")
+
     def test_highlight_empty_text(self):
         """Test highlighting with empty text"""
         text = ""
@@ -152,17 +220,89 @@ class TestHighlighting(unittest.TestCase):
         # Should not have nested <mark> tags
         self.assertNotIn("<mark><mark>", str(result))
 
+    def test_highlight_overlapping_keywords(self):
+        """Test that the longest keyword at a position wins over overlaps"""
+        text = "A data breach at Volvo"
+        keywords = ["breach", "data breach", "data"]
+        result = highlight_keywords(text, keywords)
+        self.assertEqual(
+            str(result), 'A <mark class="highlight">data breach</mark> at Volvo'
+        )
+
+
+class TestPrepareArticles(unittest.TestCase):
+    """Test precomputation of display fields"""
+
+    def test_prepare_articles_adds_display_fields(self):
+        """Test that timestamps, domains and highlights are precomputed"""
+        articles = [
+            {
+                "title": "New ransomware campaign",
+                "ingress": "",
+                "summary": "New ransomware campaign",
+                "timestamp": "2025-11-27T10:30:00Z",
+                "origin_url": "https://www.example.com/",
+            }
+        ]
+        prepare_articles(articles, ("ransomware",))
+        article = articles[0]
+        self.assertEqual(article["formatted_timestamp"], "2025-11-27 10:30")
+        self.assertEqual(article["domain"], "example.com")
+        self.assertIn('<mark class="highlight">', str(article["title_highlighted"]))
+        self.assertEqual(article["ingress_highlighted"], "")
+
+
+class TestArticleIndex(unittest.TestCase):
+    """Test precomputed tab positions"""
+
+    def test_build_article_index(self):
+        """Test that articles are indexed by tab, APT Swedish references first"""
+        articles = [
+            {"category": "international", "is_apt": True},
+            {"category": "swedish"},
+            {"category": "apt_only", "is_apt": True, "is_swedish_reference": True},
+        ]
+        article_index = build_article_index(articles)
+        self.assertIs(article_index["articles"], articles)
+        self.assertEqual(article_index["apt_swedish"], [2])
+        self.assertEqual(article_index["apt_other"], [0])
+        self.assertEqual(article_index["swedish"], [1])
+        self.assertEqual(article_index["international"], [0])
+
+
+class TestStripHtml(unittest.TestCase):
+    """Test reducing description HTML to plain text"""
+
+    def test_strip_html_removes_tags(self):
+        """Test that tags are removed and entities unescaped"""
+        self.assertEqual(_strip_html("<p>Fish &amp; <b>chips</b></p>"), "Fish & chips")
+
+    def test_strip_html_keeps_angle_brackets_in_text(self):
+        """Test that "<" and ">" outside tags are kept"""
+        self.assertEqual(_strip_html("Score <5 and >3 ok"), "Score <5 and >3 ok")
+
+    def test_strip_html_removes_comments(self):
+        """Test that comments are removed, even when they contain a >"""
+        self.assertEqual(
+            _strip_html("Before <!-- a > b --><i>after</i>"), "Before after"
+        )
+
+    def test_strip_html_removes_script_and_style(self):
+        """Test that script and style bodies are not part of the text"""
+        self.assertEqual(_strip_html("<style>p{color:red}</style>x"), "x")
+        self.assertEqual(
+            _strip_html("<SCRIPT>alert(1)</SCRIPT>Hi <b>there</b>"), "Hi there"
+        )
+
 
-class TestRSSFeed(unittest.TestCase):
+class TestRSSFeed(unittest.IsolatedAsyncioTestCase):
     """Test RSS feed scraping"""
 
-    @patch("scraper.requests.get")
-    def test_scrape_rss_feed_success(self, mock_get):
+    @patch("scraper._fetch", new_callable=AsyncMock)
+    async def test_scrape_rss_feed_success(self, mock_fetch):
         """Test successful RSS feed scraping"""
         # Mock RSS response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b"""<?xml version="1.0" encoding="UTF-8"?>
+        rss = b"""<?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0">
     <channel>
         <item>
@@ -173,7 +313,7 @@ class TestRSSFeed(unittest.TestCase):
         </item>
     </channel>
 </rss>"""
-        mock_get.return_value = mock_response
+        mock_fetch.return_value = (rss, None)
 
         site_config = {
             "name": "Test Site",
@@ -182,11 +322,334 @@ class TestRSSFeed(unittest.TestCase):
             "category": "international",
         }
 
-        articles = scrape_rss_feed(site_config)
+        articles = await scrape_rss_feed_async(Mock(), site_config)
         self.assertEqual(len(articles), 1)
         self.assertEqual(articles[0]["title"], "Test Article")
         self.assertEqual(articles[0]["link"], "https://example.com/article")
 
+    @patch("scraper._fetch", new_callable=AsyncMock)
+    async def test_scrape_rss_feed_strips_html_description(self, mock_fetch):
+        """Test that HTML in descriptions is reduced to plain text"""
+        rss = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+    <channel>
+        <item>
+            <title>Test Article</title>
+            <link>https://example.com/article</link>
+            <description>&lt;p&gt;Fish &amp;amp;
+                &lt;b&gt;chips&lt;/b&gt;&lt;/p&gt;</description>
+        </item>
+    </channel>
+</rss>"""
+        mock_fetch.return_value = (rss, None)
+
+        site_config = {
+            "name": "Test Site",
+            "url": "https://example.com",
+            "rss_url": "https://example.com/rss",
+        }
+
+        articles = await scrape_rss_feed_async(Mock(), site_config)
+        self.assertEqual(articles[0]["ingress"], "Fish & chips")
+
+
+class TestScrapeSite(unittest.IsolatedAsyncioTestCase):
+    """Test HTML site scraping"""
+
+    site_config = {
+        "name": "HTML Site",
+        "url": "https://example.se/",
+        "selectors": {"articles": "article", "title": "a", "link": "a"},
+    }
+
+    @patch("scraper._fetch", new_callable=AsyncMock)
+    async def test_scrape_site_uses_declared_charset(self, mock_fetch):
+        """Test that the charset from the response headers is used to decode"""
+        page = '<html><head><meta charset="utf-8"></head><body>'
+        page += '<article><a href="/malmo">Malmö</a></article></body></html>'
+        mock_fetch.return_value = (page.encode("iso-8859-1"), "iso-8859-1")
+
+        articles = await scrape_site_async(Mock(), self.site_config)
+        self.assertEqual(articles[0]["title"], "Malmö")
+
+    @patch("scraper._fetch", new_callable=AsyncMock)
+    async def test_scrape_site_falls_back_to_meta_charset(self, mock_fetch):
+        """Test that the page's <meta> charset is used without a declared one"""
+        page = '<html><head><meta charset="iso-8859-1"></head><body>'
+        page += '<article><a href="/malmo">Malmö</a></article></body></html>'
+        mock_fetch.return_value = (page.encode("iso-8859-1"), None)
+
+        articles = await scrape_site_async(Mock(), self.site_config)
+        self.assertEqual(articles[0]["title"], "Malmö")
+
+
+class TestIngressCache(unittest.TestCase):
+    """Test the persisted ingress cache"""
+
+    def setUp(self):
+        """Use an ingress cache stored in a temporary directory"""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        for name, value in [
+            ("_ingress_cache_file", os.path.join(tmp_dir.name, "ingress.sqlite3")),
+            ("_pending_ingress", {}),
+        ]:
+            patcher = patch(f"scraper.{name}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.restart(maxsize=100)
+
+    def restart(self, maxsize):
+        """Start from an empty in-memory cache, as after an app restart"""
+        for name, value in [
+            ("_INGRESS_CACHE", TTLCache(maxsize=maxsize, ttl=_INGRESS_CACHE_TTL)),
+            ("_ingress_cache_loaded", False),
+        ]:
+            patcher = patch(f"scraper.{name}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def store(self, url, ingress, fetched_at):
+        """Cache an ingress fetched at the given time and write it to disk"""
+        with patch("scraper.time.time", return_value=fetched_at):
+            _cache_ingress(url, ingress)
+            flush_ingress_cache()
+
+    def test_loaded_ingress_expires_by_fetch_time(self):
+        """Test that ingresses loaded from disk keep their original age"""
+        self.store("https://example.com/a", "Lead text", 1000.0)
+        self.restart(maxsize=100)
+
+        with patch("scraper.time.time", return_value=1000.0 + _INGRESS_CACHE_TTL - 60):
+            self.assertEqual(_get_cached_ingress("https://example.com/a"), "Lead text")
+        with patch("scraper.time.time", return_value=1000.0 + _INGRESS_CACHE_TTL):
+            self.assertIsNone(_get_cached_ingress("https://example.com/a"))
+
+    def test_newest_ingresses_are_loaded(self):
+        """Test that only the newest ingresses are loaded when the cache is full"""
+        for offset, name in enumerate(["a", "b", "c"]):
+            self.store(f"https://example.com/{name}", name, 1000.0 + offset)
+        self.restart(maxsize=2)
+
+        with patch("scraper.time.time", return_value=1010.0):
+            self.assertIsNone(_get_cached_ingress("https://example.com/a"))
+            self.assertEqual(_get_cached_ingress("https://example.com/b"), "b")
+            self.assertEqual(_get_cached_ingress("https://example.com/c"), "c")
+
+
+class TestScrapeAllSites(unittest.IsolatedAsyncioTestCase):
+    """Test concurrent scraping of all sites"""
+
+    def setUp(self):
+        """Use an empty ingress cache stored in a temporary directory"""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        for name, value in [
+            ("_INGRESS_CACHE", TTLCache(maxsize=100, ttl=3600)),
+            ("_ingress_cache_file", os.path.join(tmp_dir.name, "ingress.sqlite3")),
+            ("_ingress_cache_loaded", False),
+            ("_pending_ingress", {}),
+        ]:
+            patcher = patch(f"scraper.{name}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_scrape_all_sites_async_filters_and_fetches_ingress(self):
+        """Test that matching articles are kept and their ingress is fetched"""
+        rss = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+    <channel>
+        <item>
+            <title>New ransomware campaign</title>
+            <link>https://example.com/ransomware</link>
+            <pubDate>Mon, 27 Nov 2025 10:30:00 GMT</pubDate>
+        </item>
+        <item>
+            <title>Local weather report</title>
+            <link>https://example.com/weather</link>
+        </item>
+    </channel>
+</rss>"""
+        html = b'<html><body><article><a href="/malware">Malware found</a>'
+        html += b"</article></body></html>"
+        article_page = b'<html><body><p class="lead">Lead text</p></body></html>'
+        pages = {
+            "https://example.com/rss": rss,
+            "https://example.org/": html,
+            "https://example.org/malware": article_page,
+        }
+        config = {
+            "sites": [
+                {
+                    "name": "RSS Site",
+                    "url": "https://example.com/",
+                    "rss_url": "https://example.com/rss",
+                },
+                {
+                    "name": "HTML Site",
+                    "url": "https://example.org/",
+                    "selectors": {
+                        "articles": "article",
+                        "title": "a",
+                        "link": "a",
+                        "ingress": "p.lead",
+                    },
+                },
+            ]
+        }
+
+        with patch("scraper.load_config", return_value=config), patch(
+            "scraper._fetch",
+            new=AsyncMock(side_effect=lambda s, url: (pages[url], None)),
+        ):
+            articles = await scrape_all_sites_async()
+
+        titles = [a["title"] for a in articles]
+        self.assertEqual(titles, ["New ransomware campaign", "Malware found"])
+        self.assertEqual(articles[1]["ingress"], "Lead text")
+        self.assertEqual(articles[1]["summary"], "Lead text")
+
+        # The ingress is cached (and persisted), so a second scrape skips it
+        fetch = AsyncMock(side_effect=lambda s, url: (pages[url], None))
+        with patch("scraper.load_config", return_value=config), patch(
+            "scraper._fetch", new=fetch
+        ), patch("scraper._INGRESS_CACHE", TTLCache(maxsize=100, ttl=3600)), patch(
+            "scraper._ingress_cache_loaded", False
+        ):
+            articles = await scrape_all_sites_async()
+
+        fetched_urls = [call.args[1] for call in fetch.call_args_list]
+        self.assertNotIn("https://example.org/malware", fetched_urls)
+        self.assertEqual(articles[1]["ingress"], "Lead text")
+
+    async def test_scrape_all_sites_async_skips_duplicate_links(self):
+        """Test that an article listed by several feeds is only kept once"""
+        rss = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+    <channel>
+        <item>
+            <title>New ransomware campaign</title>
+            <link>https://example.com/ransomware</link>
+        </item>
+    </channel>
+</rss>"""
+        config = {
+            "sites": [
+                {"name": name, "url": "https://example.com/", "rss_url": url}
+                for name, url in [
+                    ("Feed A", "https://example.com/a"),
+                    ("Feed B", "https://example.com/b"),
+                ]
+            ]
+        }
+
+        with patch("scraper.load_config", return_value=config), patch(
+            "scraper._fetch", new=AsyncMock(return_value=(rss, None))
+        ):
+            articles = await scrape_all_sites_async()
+
+        self.assertEqual(len(articles), 1)
+        self.assertEqual(articles[0]["origin"], "Feed A")
+
+    async def test_scrape_all_sites_async_keeps_matching_duplicate(self):
+        """Test that a duplicate link is kept from the copy that matches"""
+        html = b'<html><body><article><a href="https://example.com/roundup">'
+        html += b"Weekly roundup</a></article></body></html>"
+        rss = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+    <channel>
+        <item>
+            <title>Weekly roundup</title>
+            <link>https://example.com/roundup</link>
+            <description>New ransomware hits hospitals</description>
+        </item>
+    </channel>
+</rss>"""
+        pages = {"https://example.org/": html, "https://example.com/rss": rss}
+        config = {
+            "sites": [
+                {
+                    "name": "HTML Site",
+                    "url": "https://example.org/",
+                    "selectors": {"articles": "article", "title": "a", "link": "a"},
+                },
+                {
+                    "name": "RSS Site",
+                    "url": "https://example.com/",
+                    "rss_url": "https://example.com/rss",
+                },
+            ]
+        }
+
+        fetch = AsyncMock(side_effect=lambda session, url: (pages[url], None))
+        with patch("scraper.load_config", return_value=config), patch(
+            "scraper._fetch", new=fetch
+        ):
+            articles = await scrape_all_sites_async()
+
+        self.assertEqual(len(articles), 1)
+        self.assertEqual(articles[0]["origin"], "RSS Site")
+        self.assertEqual(articles[0]["ingress"], "New ransomware hits hospitals")
+
+
+class TestRefreshArticles(unittest.TestCase):
+    """Test loading and publishing articles"""
+
+    def setUp(self):
+        """Start from empty caches and a patched scraper"""
+        self.scraped = [
+            {
+                "title": "New ransomware campaign",
+                "category": "international",
+                "is_apt": False,
+            }
+        ]
+        for patcher in [
+            patch("app.articles_cache", []),
+            patch("app.article_index_cache", build_article_index([])),
+            patch("app.last_update", None),
+            patch("app.load_all_keywords", return_value=(["ransomware"], [])),
+            patch(
+                "app.scrape_all_sites_async",
+                new=AsyncMock(side_effect=lambda *args: list(self.scraped)),
+            ),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def assert_published(self, new_articles):
+        """Check that the articles, their index and the update time moved together"""
+        self.assertEqual(new_articles[0]["title"], "New ransomware campaign")
+        self.assertIs(app.articles_cache, new_articles)
+        self.assertIs(app.article_index_cache["articles"], new_articles)
+        self.assertEqual(app.article_index_cache["international"], [0])
+        self.assertIsNotNone(app.last_update)
+
+    def test_refresh_articles_without_background_loop(self):
+        """Test refreshing with a temporary event loop"""
+        with patch("app._background_loop", None):
+            new_articles = refresh_articles()
+
+        self.assert_published(new_articles)
+
+    def test_refresh_articles_on_background_loop(self):
+        """Test refreshing on the running background loop"""
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+
+        def stop_loop():
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+        self.addCleanup(stop_loop)
+
+        with patch("app._background_loop", loop), patch("app._http_session", None):
+            new_articles = refresh_articles()
+
+        self.assert_published(new_articles)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)